@@ -9,6 +9,7 @@ from pathlib import Path
 
 # Import the LibreOffice parser
 from tech_libreoffice import main as parse_excel
+from tech_libreoffice import uses_libreoffice
 
 
 def parse_excel_task():
@@ -29,12 +30,18 @@ def parse_excel_task():
         print("\n🐳 Running inside Docker container")
         host = "127.0.0.1"
         auto_start = False  # LibreOffice already running via Dockerfile CMD
-        print(f"   Connecting to existing LibreOffice at {host}:2002")
     else:
         print("\n💻 Running locally")
         host = "localhost"
         auto_start = True  # Start LibreOffice locally
+    
+    # .xlsx/.xlsm files are read with openpyxl and never touch LibreOffice
+    if not uses_libreoffice(file_path):
+        print("   Reading with openpyxl (LibreOffice not needed)")
+    elif auto_start:
         print(f"   Will start LibreOffice at {host}:2002")
+    else:
+        print(f"   Connecting to existing LibreOffice at {host}:2002")
     
     print(f"\n📄 Excel file: {file_path}")
     
@@ -61,13 +68,16 @@ def parse_excel_task():
         output_dir.mkdir(exist_ok=True)
         
         output_file = output_dir / "parsed_cells.txt"
-        with open(output_file, "w") as f:
-            f.write(f"Parsed {len(cells)} cells from {file_path}\n\n")
-            for cell in cells:
-                f.write(f"Cell {cell.cell_number}:\n")
-                for segment in cell.color_groups:
-                    f.write(f"  RGB({segment.r}, {segment.g}, {segment.b}): {segment.text}\n")
-                f.write("\n")
+        parts = [f"Parsed {len(cells)} cells from {file_path}\n\n"]
+        for cell in cells:
+            parts.append(f"Cell {cell.cell_number}:\n")
+            parts.extend(
+                f"  RGB({segment.r}, {segment.g}, {segment.b}): {segment.text}\n"
+                for segment in cell.color_groups
+            )
+            parts.append("\n")
+        # Single write keeps mounted output volumes from flushing per segment
+        output_file.write_text("".join(parts))
         
         print(f"\n📝 Results saved to: {output_file}")
         
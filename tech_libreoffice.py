@@ -2,10 +2,12 @@
 """
 Parse Excel cells with rich text formatting using LibreOffice UNO API.
 This provides character-level color access for legacy Excel files.
+.xlsx files are read directly with openpyxl, without starting LibreOffice.
 
 Requirements:
 - LibreOffice installed
 - uno Python package (comes with LibreOffice)
+- openpyxl (for .xlsx files)
 
 Usage:
 1. Start LibreOffice in headless mode with socket:
@@ -15,17 +17,43 @@ Usage:
    python tech_libreoffice.py
 """
 
+import atexit
+import colorsys
+import contextlib
+import datetime
+import functools
+import gc
 import os
+import queue
+import re
+import socket
+import subprocess
+import sys
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import IntEnum
 from typing import Any
+from xml.etree import ElementTree
 
-from pydantic import BaseModel
-
-# Import UNO - this comes with LibreOffice (NOT from PyPI)
+# Import UNO - this comes with LibreOffice (NOT from PyPI). Only the legacy
+# format path needs it; .xlsx files are parsed with openpyxl alone.
 try:
     import uno
     from com.sun.star.beans import PropertyValue
-except ImportError as e:
+    from com.sun.star.beans.PropertyState import AMBIGUOUS_VALUE
+    HAS_UNO = True
+except ImportError:
+    HAS_UNO = False
+
+
+def require_uno() -> None:
+    """Exit with installation instructions if LibreOffice's Python bridge is missing."""
+    if HAS_UNO:
+        return
+    
     print("=" * 80)
     print("ERROR: UNO not found. LibreOffice's Python bridge is required.")
     print("=" * 80)
@@ -41,10 +69,31 @@ except ImportError as e:
     print("\nAlternatively, add LibreOffice's Python to PYTHONPATH:")
     print("  export PYTHONPATH=/path/to/libreoffice/python:$PYTHONPATH")
     print("=" * 80)
-    raise SystemExit(1) from e
+    raise SystemExit(1)
+
 
+class ColorCategory(IntEnum):
+    """Coarse color buckets used to classify segments."""
+    OTHER = 0
+    BLACK = 1
+    RED = 2
+    BLUE = 3
 
-class Segment(BaseModel):
+
+def classify_rgb(r: int, g: int, b: int) -> ColorCategory:
+    """Bucket an RGB color (with some leeway) into a ColorCategory."""
+    if r <= 30 and g <= 30 and b <= 30:
+        return ColorCategory.BLACK
+    if g < 80:
+        if r > 200 and b < 80:
+            return ColorCategory.RED
+        if b > 200 and r < 80:
+            return ColorCategory.BLUE
+    return ColorCategory.OTHER
+
+
+@dataclass(slots=True)
+class Segment:
     """Represents a text segment with RGB color information."""
     r: int
     g: int
@@ -52,30 +101,48 @@ class Segment(BaseModel):
     text: str
     is_default_color: bool = False
     
+    @property
+    def category(self) -> ColorCategory:
+        """Color bucket of the segment, following any later change to r/g/b."""
+        return classify_rgb(self.r, self.g, self.b)
+    
     @property
     def is_black(self) -> bool:
         """Check if color is black (with some leeway)."""
-        return self.r <= 30 and self.g <= 30 and self.b <= 30
+        return self.category is ColorCategory.BLACK
     
     @property
     def is_red(self) -> bool:
         """Check if color is red (with some leeway)."""
-        return self.r > 200 and self.g < 80 and self.b < 80
+        return self.category is ColorCategory.RED
     
     @property
     def is_blue(self) -> bool:
         """Check if color is blue (with some leeway)."""
-        return self.r < 80 and self.g < 80 and self.b > 200
+        return self.category is ColorCategory.BLUE
 
 
-class Cell(BaseModel):
+@dataclass(slots=True)
+class Cell:
     """Represents an Excel cell with rich text segments."""
     cell_number: str
     color_groups: list[Segment]
 
 
+# Cells shorter than this are parsed without progress output
+PROGRESS_MIN_CHARS = 500
+# Characters processed between progress updates
+PROGRESS_INTERVAL = 1000
+
+
+def _no_flush() -> None:
+    """Stand-in flush for progress writers that handle flushing themselves."""
+
+
+@functools.lru_cache(maxsize=None)
 def rgb_from_long(color_long: int) -> tuple[int, int, int]:
     """Convert LibreOffice color (long integer) to RGB tuple."""
+    # A workbook only uses a handful of distinct colors, so this is cached
     # LibreOffice stores colors as RGB in a long integer
     r = (color_long >> 16) & 0xFF
     g = (color_long >> 8) & 0xFF
@@ -83,23 +150,28 @@ def rgb_from_long(color_long: int) -> tuple[int, int, int]:
     return (r, g, b)
 
 
-def connect_to_libreoffice(host: str = "localhost", port: int = 2002) -> Any:
+def open_bridge(host: str = "localhost", port: int = 2002) -> tuple[Any, Any]:
     """
-    Connect to a running LibreOffice instance.
+    Open a UNO bridge to a running LibreOffice instance.
+    
+    Unlike resolving a uno: URL, this keeps hold of the bridge so the
+    connection can be closed with bridge.dispose() once it is no longer needed.
     
     Returns:
-        Component context for LibreOffice
+        The bridge and the component context for LibreOffice
     """
+    require_uno()
     local_context = uno.getComponentContext()
-    resolver = local_context.ServiceManager.createInstanceWithContext(
-        "com.sun.star.bridge.UnoUrlResolver", local_context
-    )
-    
-    url = f"uno:socket,host={host},port={port};urp;StarOffice.ComponentContext"
+    smgr = local_context.ServiceManager
     
     try:
-        context = resolver.resolve(url)
-        return context
+        connector = smgr.createInstanceWithContext("com.sun.star.connection.Connector", local_context)
+        connection = connector.connect(f"socket,host={host},port={port}")
+        bridge_factory = smgr.createInstanceWithContext("com.sun.star.bridge.BridgeFactory", local_context)
+        # An empty name gives an anonymous bridge that is not shared with other callers
+        bridge = bridge_factory.createBridge("", "urp", connection, None)
+        context = bridge.getInstance("StarOffice.ComponentContext")
+        return bridge, context
     except Exception as e:
         raise ConnectionError(
             f"Could not connect to LibreOffice at {host}:{port}. "
@@ -108,12 +180,48 @@ def connect_to_libreoffice(host: str = "localhost", port: int = 2002) -> Any:
         ) from e
 
 
-def start_libreoffice_headless(port: int = 2002, timeout: int = 10, host: str = "localhost") -> bool:
+def connect_to_libreoffice(host: str = "localhost", port: int = 2002) -> Any:
+    """
+    Connect to a running LibreOffice instance.
+    
+    The connection stays open until the process exits; use open_bridge()
+    to be able to close it earlier.
+    
+    Returns:
+        Component context for LibreOffice
+    """
+    return open_bridge(host=host, port=port)[1]
+
+
+def wait_for_libreoffice(host: str = "localhost", port: int = 2002, timeout: float = 30.0) -> bool:
+    """
+    Wait until LibreOffice accepts connections on its UNO socket.
+    
+    Probes the TCP port every 100 ms so callers return as soon as the
+    listener is up instead of sleeping for a fixed amount of time.
+    
+    Returns:
+        True if the socket accepted a connection before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.1)
+            if sock.connect_ex((host, port)) == 0:
+                return True
+        time.sleep(0.1)
+    return False
+
+
+def start_libreoffice_headless(
+    port: int = 2002, timeout: int = 10, host: str = "localhost"
+) -> subprocess.Popen | None:
     """
     Start LibreOffice in headless mode with socket connection.
     
     Returns:
-        True if LibreOffice started successfully, False otherwise
+        The soffice process if LibreOffice started successfully, None otherwise.
+        The caller owns the process and should stop it when done.
     """
     print(f"  Starting LibreOffice on {host}:{port}...")
     
@@ -133,34 +241,41 @@ def start_libreoffice_headless(port: int = 2002, timeout: int = 10, host: str =
     
     if not soffice_cmd:
         print("  ERROR: Could not find soffice executable")
-        return False
+        return None
     
-    cmd = f'{soffice_cmd} --headless --accept="socket,host={host},port={port};urp;StarOffice.ComponentContext" &'
-    print(f"  Running: {cmd}")
-    _ = os.system(cmd)
+    argv = [
+        soffice_cmd,
+        "--headless",
+        f"--accept=socket,host={host},port={port};urp;StarOffice.ComponentContext",
+    ]
+    print(f"  Running: {' '.join(argv)}")
+    try:
+        process = subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"  ERROR: Could not launch soffice: {e}")
+        return None
     
     # Wait for LibreOffice socket to be ready
     print(f"  Waiting for LibreOffice socket (timeout: {timeout}s)...", end="", flush=True)
-    for _ in range(timeout):
-        time.sleep(1)
-        print(".", end="", flush=True)
-        
-        # Try to actually connect to verify socket is ready
-        try:
-            local_context = uno.getComponentContext()
-            resolver = local_context.ServiceManager.createInstanceWithContext(
-                "com.sun.star.bridge.UnoUrlResolver", local_context
-            )
-            url = f"uno:socket,host={host},port={port};urp;StarOffice.ComponentContext"
-            resolver.resolve(url)
-            print(" Socket ready!")
-            return True
-        except Exception:
-            # Socket not ready yet, continue waiting
-            pass
+    if wait_for_libreoffice(host=host, port=port, timeout=timeout):
+        print(" Socket ready!")
+        return process
     
     print(" Timeout!")
-    return False
+    # Don't leave a half-started soffice running behind us
+    stop_process(process)
+    return None
+
+
+def stop_process(process: subprocess.Popen, timeout: float = 10.0) -> None:
+    """Terminate a process and wait for it, killing it if it does not exit in time."""
+    if process.poll() is None:
+        process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
 
 
 def load_spreadsheet(context: Any, file_path: str) -> Any:
@@ -174,6 +289,7 @@ def load_spreadsheet(context: Any, file_path: str) -> Any:
     Returns:
         Spreadsheet document object
     """
+    require_uno()
     smgr = context.ServiceManager
     desktop = smgr.createInstanceWithContext("com.sun.star.frame.Desktop", context)
     
@@ -191,241 +307,964 @@ def load_spreadsheet(context: Any, file_path: str) -> Any:
     return document
 
 
-def parse_cell_rich_text(cell: Any, cell_ref: str, show_progress: bool = True) -> Cell:
+# CharColor value LibreOffice uses for the "automatic" color
+AUTOMATIC_COLOR = -1
+
+
+def read_char_color(text_range: Any) -> int:
+    """
+    Read the raw CharColor of a text range.
+    
+    Returns:
+        Color as a long integer, or AUTOMATIC_COLOR for the default color
+    """
+    try:
+        char_color_long = text_range.getPropertyValue("CharColor")
+    except Exception:
+        # If we can't get color, use black as default
+        return AUTOMATIC_COLOR
+    
+    # LibreOffice returns -1 (0xFFFFFFFF) for "automatic" color
+    if char_color_long == 0xFFFFFFFF:
+        return AUTOMATIC_COLOR
+    return char_color_long
+
+
+def char_color_to_rgb(char_color_long: int) -> tuple[tuple[int, int, int], bool]:
+    """
+    Convert a raw CharColor to RGB.
+    
+    Returns:
+        RGB tuple and whether the color is LibreOffice's "automatic" default,
+        which is treated as black (0, 0, 0)
+    """
+    if char_color_long == AUTOMATIC_COLOR:
+        return (0, 0, 0), True
+    return rgb_from_long(char_color_long), False
+
+
+def resolve_char_color(text_range: Any) -> tuple[tuple[int, int, int], bool]:
+    """
+    Read the CharColor of a text range.
+    
+    Returns:
+        RGB tuple and whether the color is LibreOffice's "automatic" default
+    """
+    return char_color_to_rgb(read_char_color(text_range))
+
+
+def _parse_plain_cell(cursor: Any, cell_text: str, cell_ref: str) -> Cell | None:
+    """
+    Fast path for cells whose text uses a single color.
+    
+    Selects the whole text once and asks LibreOffice whether CharColor is
+    uniform across it, which avoids walking the text character by character.
+    
+    Returns:
+        Cell with a single segment, or None if the cell mixes colors
+    """
+    cursor.gotoStart(False)
+    cursor.gotoEnd(True)
+    
+    try:
+        if cursor.getPropertyState("CharColor") == AMBIGUOUS_VALUE:
+            return None
+    except Exception:
+        return None
+    
+    (r, g, b), is_default = resolve_char_color(cursor)
+    segment = Segment(r=r, g=g, b=b, text=cell_text, is_default_color=is_default)
+    return Cell(cell_number=cell_ref, color_groups=[segment])
+
+
+def _parse_rich_cell(
+    text: Any,
+    cell_text: str,
+    cell_ref: str,
+    show_progress: bool,
+    write_progress: Callable[[str], Any] | None = None,
+) -> Cell:
+    """
+    Group a multi-colored cell into runs of equal color.
+    
+    Enumerates the cell's paragraphs and their text portions. Each portion
+    already has uniform formatting, so one CharColor read per portion
+    replaces the old per-character cursor walk. Adjacent portions that
+    resolve to the same color are merged.
+    
+    Progress text goes to write_progress when given, otherwise to stdout.
+    """
+    # (raw CharColor, text) runs; colors are decoded and Segment objects
+    # built only on return
+    raw_segments: list[tuple[int, str]] = []
+    
+    total = len(cell_text)
+    # Progress output only pays off on long cells
+    show_progress = show_progress and total >= PROGRESS_MIN_CHARS
+    if write_progress is None:
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+    else:
+        write = write_progress
+        flush = _no_flush
+    next_report = PROGRESS_INTERVAL
+    
+    if show_progress:
+        write(f"    Processing {total} characters...")
+        flush()
+    
+    current_color_long: int | None = None
+    current_parts: list[str] = []
+    processed = 0
+    
+    paragraphs = text.createEnumeration()
+    first_paragraph = True
+    while paragraphs.hasMoreElements():
+        paragraph = paragraphs.nextElement()
+        
+        # getString() joins paragraphs with a newline; keep it in the current run
+        if not first_paragraph:
+            current_parts.append("\n")
+            processed += 1
+        first_paragraph = False
+        
+        portions = paragraph.createEnumeration()
+        while portions.hasMoreElements():
+            portion = portions.nextElement()
+            portion_text = portion.getString()
+            if not portion_text:
+                continue
+            
+            processed += len(portion_text)
+            if show_progress and processed >= next_report:
+                write(f"\r    Processing {total} characters... {processed}/{total} ({processed*100//total}%)")
+                flush()
+                next_report = processed + PROGRESS_INTERVAL
+            
+            portion_color_long = read_char_color(portion)
+            
+            # Check if color changed
+            if current_color_long is None:
+                current_color_long = portion_color_long
+                current_parts.append(portion_text)
+            elif current_color_long == portion_color_long:
+                current_parts.append(portion_text)
+            else:
+                # Color changed, save current segment
+                raw_segments.append((current_color_long, "".join(current_parts)))
+                current_color_long = portion_color_long
+                current_parts = [portion_text]
+    
+    if show_progress:
+        write(f"\r    Processing {total} characters... Done!     \n")
+    
+    # Add final segment
+    current_text = "".join(current_parts)
+    if current_text:
+        raw_segments.append((
+            current_color_long if current_color_long is not None else AUTOMATIC_COLOR,
+            current_text,
+        ))
+    
+    segments = []
+    for color_long, segment_text in raw_segments:
+        (r, g, b), is_default = char_color_to_rgb(color_long)
+        segments.append(Segment(r=r, g=g, b=b, text=segment_text, is_default_color=is_default))
+    
+    return Cell(cell_number=cell_ref, color_groups=segments)
+
+
+def parse_cell_rich_text(
+    cell: Any,
+    cell_ref: str,
+    show_progress: bool = True,
+    write_progress: Callable[[str], Any] | None = None,
+) -> Cell:
     """
     Parse rich text from a LibreOffice cell with character-level color extraction.
     
     Args:
         cell: LibreOffice cell object
         cell_ref: Cell reference (e.g., "A1")
-        show_progress: Whether to show character-by-character progress
+        show_progress: Whether to show progress while walking the cell's text
+        write_progress: Where to send progress text (defaults to stdout)
     
     Returns:
         Cell object with color segments
     """
-    segments: list[Segment] = []
-    
     # Get cell text
     cell_text = cell.getString()
     if not cell_text:
         return Cell(cell_number=cell_ref, color_groups=[])
     
-    if show_progress:
-        print(f"    Processing {len(cell_text)} characters...", end="", flush=True)
-    
     # Access the cell's text cursor for character-level formatting
     text = cell.getText()
     cursor = text.createTextCursor()
     
-    current_color: tuple[int, int, int] | None = None
-    current_text = ""
-    current_is_default = False
+    plain = _parse_plain_cell(cursor, cell_text, cell_ref)
+    if plain is not None:
+        return plain
+    
+    return _parse_rich_cell(text, cell_text, cell_ref, show_progress, write_progress)
+
+
+def _column_letters(col: int) -> str:
+    """Convert a zero-based column index to Excel-style letters (e.g., 0 -> A)."""
+    col_letter = ""
+    col_num = col + 1  # LibreOffice uses 0-based indexing
+    
+    while col_num > 0:
+        col_num -= 1
+        col_letter = chr(65 + (col_num % 26)) + col_letter
+        col_num //= 26
+    
+    return col_letter
+
+
+# Column letters for every column a sheet can have (Excel's maximum is XFD)
+MAX_COLUMNS = 16384
+COL_LETTERS = [_column_letters(col) for col in range(MAX_COLUMNS)]
+
+
+def get_cell_reference(col: int, row: int) -> str:
+    """Convert column and row numbers to Excel-style reference (e.g., A1)."""
+    if col < MAX_COLUMNS:
+        return f"{COL_LETTERS[col]}{row + 1}"
+    return f"{_column_letters(col)}{row + 1}"
+
+
+# Order of the <a:clrScheme> children as addressed by Excel theme color indices
+THEME_COLOR_TAGS = (
+    "lt1", "dk1", "lt2", "dk2",
+    "accent1", "accent2", "accent3", "accent4", "accent5", "accent6",
+    "hlink", "folHlink",
+)
+DRAWINGML_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+# Indexed colors 64 and up are the system foreground/background, i.e. automatic
+SYSTEM_COLOR_INDEX = 64
+
+
+@functools.lru_cache(maxsize=None)
+def rgb_from_hex(hex_color: str) -> tuple[int, int, int]:
+    """Convert an RGB or ARGB hex string (e.g., "FFFF0000") to an RGB tuple."""
+    hex_color = hex_color[-6:]
+    return (int(hex_color[0:2], 16), int(hex_color[2:4], 16), int(hex_color[4:6], 16))
+
+
+def read_theme_colors(theme_xml: bytes | None) -> tuple[tuple[int, int, int], ...]:
+    """
+    Extract the theme palette from a workbook's theme part.
+    
+    Returns:
+        RGB tuples indexed like Excel theme colors (lt1, dk1, lt2, dk2, accents...)
+    """
+    if not theme_xml:
+        return ()
+    
+    root = ElementTree.fromstring(theme_xml)
+    scheme = root.find(f"{DRAWINGML_NS}themeElements/{DRAWINGML_NS}clrScheme")
+    if scheme is None:
+        return ()
+    
+    colors = []
+    for tag in THEME_COLOR_TAGS:
+        element = scheme.find(f"{DRAWINGML_NS}{tag}")
+        value = None
+        if element is not None and len(element):
+            # <a:srgbClr val="..."/> or <a:sysClr val="windowText" lastClr="..."/>
+            value = element[0].get("val") if element[0].tag == f"{DRAWINGML_NS}srgbClr" else element[0].get("lastClr")
+        colors.append(rgb_from_hex(value) if value else (0, 0, 0))
+    return tuple(colors)
+
+
+@functools.lru_cache(maxsize=None)
+def apply_tint(rgb: tuple[int, int, int], tint: float) -> tuple[int, int, int]:
+    """Apply an Excel tint (-1.0 to 1.0) to a color by scaling its luminance."""
+    if not tint:
+        return rgb
+    
+    h, lum, sat = colorsys.rgb_to_hls(rgb[0] / 255, rgb[1] / 255, rgb[2] / 255)
+    lum = lum * (1 + tint) if tint < 0 else lum * (1 - tint) + tint
+    r, g, b = colorsys.hls_to_rgb(h, lum, sat)
+    return (round(r * 255), round(g * 255), round(b * 255))
+
+
+def resolve_openpyxl_color(
+    color: Any,
+    theme_colors: tuple[tuple[int, int, int], ...],
+    indexed_colors: tuple[str, ...],
+) -> tuple[tuple[int, int, int], bool]:
+    """
+    Resolve an openpyxl Color to RGB.
+    
+    Returns:
+        RGB tuple and whether the color is the automatic default
+    """
+    if color is None:
+        return (0, 0, 0), True
+    
+    color_type = color.type
+    if color_type == "rgb" and color.rgb:
+        return rgb_from_hex(color.rgb), False
+    if color_type == "theme" and color.theme < len(theme_colors):
+        return apply_tint(theme_colors[color.theme], color.tint or 0.0), False
+    if color_type == "indexed" and color.indexed < min(len(indexed_colors), SYSTEM_COLOR_INDEX):
+        return rgb_from_hex(indexed_colors[color.indexed]), False
+    
+    # "auto", the system colors and anything we can't resolve render as black
+    return (0, 0, 0), True
+
+
+# Fixed-point number formats such as 0, 0.00, #,##0.00 and 0.00%
+FIXED_NUMBER_FORMAT = re.compile(r"(?P<grouping>#,##)?0(?:\.(?P<decimals>0+))?(?P<percent>%)?")
+# Date/time codes, quoted literals, escaped characters and anything else one character at a time
+DATE_FORMAT_TOKEN = re.compile(r'yyyy|yy|mmmmm|mmmm|mmm|mm|m|dddd|ddd|dd|d|hh|h|ss|s|am/pm|"[^"]*"|\\.|.', re.IGNORECASE)
+# Built-in format 14 is shown as the locale's short date; this is the en-US one LibreOffice uses
+SHORT_DATE_FORMATS = {"mm-dd-yy": "mm/dd/yy"}
+
+
+def format_date_value(value: datetime.date | datetime.time, number_format: str) -> str:
+    """Render a date, time or datetime with an Excel date/time number format."""
+    number_format = SHORT_DATE_FORMATS.get(number_format, number_format)
+    # Drop locale and color prefixes like [$-409] and [Red]
+    tokens = DATE_FORMAT_TOKEN.findall(re.sub(r"\[[^\]]*\]", "", number_format.split(";")[0]))
+    twelve_hour = any(token.lower() == "am/pm" for token in tokens)
+    hour = getattr(value, "hour", 0)
+    
+    parts = []
+    for index, token in enumerate(tokens):
+        code = token.lower()
+        if code in ("m", "mm"):
+            # m means minutes right after an hour code or right before a seconds code
+            previous = next((t.lower() for t in reversed(tokens[:index]) if t.isalpha()), "")
+            following = next((t.lower() for t in tokens[index + 1:] if t.isalpha()), "")
+            if previous.startswith("h") or following.startswith("s"):
+                parts.append(f"{value.minute:0{len(code)}d}")
+            else:
+                parts.append(f"{value.month:0{len(code)}d}")
+        elif code == "yyyy":
+            parts.append(f"{value.year:04d}")
+        elif code == "yy":
+            parts.append(f"{value.year % 100:02d}")
+        elif code in ("mmm", "mmmm", "mmmmm"):
+            name = value.strftime("%B")
+            parts.append(name[:{"mmm": 3, "mmmm": len(name), "mmmmm": 1}[code]])
+        elif code in ("d", "dd"):
+            parts.append(f"{value.day:0{len(code)}d}")
+        elif code in ("ddd", "dddd"):
+            parts.append(value.strftime("%a" if code == "ddd" else "%A"))
+        elif code in ("h", "hh"):
+            shown_hour = (hour % 12 or 12) if twelve_hour else hour
+            parts.append(f"{shown_hour:0{len(code)}d}")
+        elif code in ("s", "ss"):
+            parts.append(f"{value.second:0{len(code)}d}")
+        elif code == "am/pm":
+            parts.append("AM" if hour < 12 else "PM")
+        elif token.startswith('"'):
+            parts.append(token[1:-1])
+        elif token.startswith("\\"):
+            parts.append(token[1:])
+        else:
+            parts.append(token)
+    return "".join(parts)
+
+
+def format_cell_value(value: Any, number_format: str) -> str:
+    """
+    Render a non-text cell value the way LibreOffice's getString() shows it.
+    
+    Covers booleans, General numbers, fixed-point formats (0.00, #,##0,
+    0.00% ...) and the usual date/time codes. Anything else, such as
+    fractions, scientific formats or elapsed-time durations, falls back to
+    str(value).
+    """
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (datetime.date, datetime.time)):
+        return format_date_value(value, number_format)
+    if isinstance(value, (int, float)):
+        section = number_format.split(";")[0]
+        if section == "General":
+            return str(value) if isinstance(value, int) else f"{value:.10g}".upper()
+        fixed = FIXED_NUMBER_FORMAT.fullmatch(section)
+        if fixed:
+            shown = value * 100 if fixed["percent"] else value
+            grouping = "," if fixed["grouping"] else ""
+            decimals = len(fixed["decimals"] or "")
+            return f"{shown:{grouping}.{decimals}f}{fixed['percent'] or ''}"
+    return str(value)
+
+
+def parse_xlsx(file_path: str) -> Iterator[Cell]:
+    """
+    Parse the first sheet of an .xlsx file directly with openpyxl.
+    
+    The rich text runs and their colors are stored in the OOXML itself, so
+    this avoids starting LibreOffice and every UNO round trip.
     
-    # Iterate through each character
-    for i in range(len(cell_text)):
-        # Show progress every 100 characters
-        if show_progress and i > 0 and i % 100 == 0:
-            print(f"\r    Processing {len(cell_text)} characters... {i}/{len(cell_text)} ({i*100//len(cell_text)}%)", end="", flush=True)
+    Args:
+        file_path: Path to the .xlsx file
+    
+    Yields:
+        Cell objects with rich text segments, in sheet order
+    """
+    from openpyxl import load_workbook
+    from openpyxl.cell.rich_text import CellRichText, TextBlock
+    from openpyxl.styles.colors import COLOR_INDEX
+    
+    print(f"Parsing {file_path} using openpyxl...")
+    # read_only=True is not used: openpyxl's read-only reader drops the runs of
+    # inline rich strings, which is how openpyxl itself saves rich text.
+    # data_only=True reports formula cells by their cached result, as UNO does.
+    workbook = load_workbook(file_path, rich_text=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[0]
+        print(f"\nWorksheet: {worksheet.title}")
+        print("=" * 80)
         
-        # Move cursor to character position
-        cursor.gotoStart(False)
-        cursor.goRight(i, False)
-        cursor.goRight(1, True)  # Select one character
+        # Resolve workbook-wide palettes once rather than per segment
+        theme_colors = read_theme_colors(workbook.loaded_theme)
+        indexed_colors = tuple(getattr(workbook, "_colors", None) or COLOR_INDEX)
+        # Keyed on the (hashable) Color itself; cell.font hands out a fresh
+        # proxy object on every access, so its id() is not a stable key
+        font_colors: dict[Any, tuple[tuple[int, int, int], bool]] = {}
         
-        # Get character color
-        try:
-            char_color_long = cursor.getPropertyValue("CharColor")
-            # LibreOffice returns -1 (0xFFFFFFFF) for "automatic" color
-            # which should be treated as black (0, 0, 0)
-            if char_color_long == -1 or char_color_long == 0xFFFFFFFF:
-                char_color = (0, 0, 0)
-                is_default = True
-            else:
-                char_color = rgb_from_long(char_color_long)
-                is_default = False
-        except Exception:
-            # If we can't get color, use black as default
-            char_color = (0, 0, 0)
-            is_default = True
+        def font_color(font: Any) -> tuple[tuple[int, int, int], bool]:
+            color = font.color
+            if color not in font_colors:
+                font_colors[color] = resolve_openpyxl_color(color, theme_colors, indexed_colors)
+            return font_colors[color]
         
-        char = cell_text[i]
+        for row in worksheet.iter_rows():
+            for cell in row:
+                value = cell.value
+                if value is None or value == "":
+                    continue
+                
+                cell_color = font_color(cell.font)
+                if isinstance(value, CellRichText):
+                    runs = [
+                        (font_color(block.font) if isinstance(block, TextBlock) else cell_color, str(block))
+                        for block in value
+                    ]
+                elif isinstance(value, str):
+                    runs = [(cell_color, value)]
+                else:
+                    # Numbers, dates and booleans: use the displayed text, as UNO's getString() does
+                    runs = [(cell_color, format_cell_value(value, cell.number_format))]
+                
+                # Merge adjacent runs with the same color; automatic and explicit
+                # black stay separate, as on the UNO path
+                raw_segments: list[tuple[tuple[int, int, int], str, bool]] = []
+                for (rgb, is_default), run_text in runs:
+                    if not run_text:
+                        continue
+                    if raw_segments and raw_segments[-1][0] == rgb and raw_segments[-1][2] == is_default:
+                        raw_segments[-1] = (rgb, raw_segments[-1][1] + run_text, is_default)
+                    else:
+                        raw_segments.append((rgb, run_text, is_default))
+                
+                yield Cell(
+                    cell_number=cell.coordinate,
+                    color_groups=[
+                        Segment(r=r, g=g, b=b, text=segment_text, is_default_color=is_default)
+                        for (r, g, b), segment_text, is_default in raw_segments
+                    ],
+                )
+    finally:
+        workbook.close()
+
+
+def format_cell_report(cell: Cell) -> str:
+    """Render the per-segment details of a parsed cell as a single string."""
+    lines = [f"  Total segments: {len(cell.color_groups)}\n"]
+    for i, segment in enumerate(cell.color_groups, 1):
+        lines.append(
+            f"\n  Segment {i}:\n"
+            f"    RGB: ({segment.r}, {segment.g}, {segment.b})\n"
+            f"    Text: {segment.text[:50]}{'...' if len(segment.text) > 50 else ''}\n"
+            f"    is_default_color: {segment.is_default_color}\n"
+            f"    is_black: {segment.is_black}\n"
+            f"    is_red: {segment.is_red}\n"
+            f"    is_blue: {segment.is_blue}\n"
+        )
+    lines.append("\n")
+    return "".join(lines)
+
+
+def print_cell_result(cell: Cell, index: int, verbose: bool) -> None:
+    """Print the outcome of parsing one cell."""
+    if verbose:
+        # Emit the whole cell report in one write instead of a print per line
+        sys.stdout.write(f"\n[{index}] Cell {cell.cell_number}:\n{format_cell_report(cell)}")
+    else:
+        print(f"[{index}] Cell {cell.cell_number}: {len(cell.color_groups)} segments")
+
+
+def find_open_document(context: Any, file_path: str) -> Any:
+    """
+    Find a document that is already open in LibreOffice.
+    
+    Returns:
+        The matching document, or None if it is not open
+    """
+    smgr = context.ServiceManager
+    desktop = smgr.createInstanceWithContext("com.sun.star.frame.Desktop", context)
+    file_url = uno.systemPathToFileUrl(os.path.abspath(file_path))
+    
+    components = desktop.getComponents().createEnumeration()
+    while components.hasMoreElements():
+        component = components.nextElement()
+        if component.getURL() == file_url:
+            return component
+    return None
+
+
+def parse_cells_concurrently(
+    session: "LibreOfficeSession",
+    file_path: str,
+    positions: list[tuple[int, int]],
+    workers: int = 8,
+) -> Iterator[Cell]:
+    """
+    Parse cells of the first sheet of an already open document on a thread pool.
+    
+    Parsing is dominated by blocking UNO round trips, so threads overlap
+    that latency despite the GIL. Each worker borrows its own connection
+    from the session on first use and hands it back when the run ends, so
+    later files reuse the same connections.
+    
+    Args:
+        session: Open session the document was loaded through
+        file_path: Path of the spreadsheet, which must already be loaded
+        positions: Zero-based (column, row) pairs to parse
+        workers: Number of worker threads
+    
+    Yields:
+        Cell objects in the same order as positions
+    """
+    local = threading.local()
+    borrowed: list[Any] = []
+    borrowed_lock = threading.Lock()
+    
+    def parse_one(position: tuple[int, int]) -> Cell:
+        sheet = getattr(local, "sheet", None)
+        if sheet is None:
+            context = session.acquire_worker_context()
+            with borrowed_lock:
+                borrowed.append(context)
+            document = find_open_document(context, file_path)
+            if document is None:
+                raise RuntimeError(f"{file_path} is not open in LibreOffice")
+            sheet = local.sheet = document.getSheets().getByIndex(0)
+        
+        col_idx, row_idx = position
+        cell = sheet.getCellByPosition(col_idx, row_idx)
+        return parse_cell_rich_text(cell, get_cell_reference(col_idx, row_idx), show_progress=False)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(parse_one, positions)
+    finally:
+        for context in borrowed:
+            session.release_worker_context(context)
+
+
+class LibreOfficeSession:
+    """
+    A LibreOffice connection that can be reused to parse many files.
+    
+    Starting soffice and connecting to it takes seconds, so batch callers
+    should open one session and call parse()/iter_cells() for each file.
+    
+    Usage:
+        with LibreOfficeSession(host="127.0.0.1") as session:
+            cells = session.parse("Book.xls")
+    """
+    
+    def __init__(self, auto_start: bool = True, host: str = "localhost", port: int = 2002) -> None:
+        """
+        Args:
+            auto_start: Whether to automatically start LibreOffice
+            host: Host to connect to (use "127.0.0.1" in Docker containers)
+            port: Port to connect to
+        """
+        self.auto_start = auto_start
+        self.host = host
+        self.port = port
+        self.context: Any = None
+        # The UNO bridge behind context, disposed on close()
+        self.bridge: Any = None
+        # The soffice we started, if any; close() stops it again
+        self.process: subprocess.Popen | None = None
+        # Extra connections for parse_cells_concurrently workers, reused across files
+        self._worker_connections: list[tuple[Any, Any]] = []
+        self._idle_worker_contexts: list[Any] = []
+        self._worker_lock = threading.Lock()
+    
+    def __enter__(self) -> "LibreOfficeSession":
+        self.open()
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def open(self) -> None:
+        """Start LibreOffice if requested and connect to it."""
+        if self.context is not None:
+            return
         
-        # Check if color changed
-        if current_color is None:
-            current_color = char_color
-            current_text = char
-            current_is_default = is_default
-        elif current_color == char_color:
-            current_text += char
+        require_uno()
+        
+        # Start LibreOffice if requested
+        if self.auto_start:
+            print("Starting LibreOffice in headless mode...")
+            self.process = start_libreoffice_headless(port=self.port, host=self.host)
+            if self.process is None:
+                print("\nFailed to start LibreOffice automatically.")
+                print("Please start it manually:")
+                print(f'  soffice --headless --accept="socket,host={self.host},port={self.port};urp;StarOffice.ComponentContext" &')
+                print("\nOr on macOS:")
+                print(f'  /Applications/LibreOffice.app/Contents/MacOS/soffice --headless --accept="socket,host={self.host},port={self.port};urp;StarOffice.ComponentContext" &')
+                raise RuntimeError("Failed to start LibreOffice")
         else:
-            # Color changed, save current segment
-            segments.append(Segment(
-                r=current_color[0],
-                g=current_color[1],
-                b=current_color[2],
-                text=current_text,
-                is_default_color=current_is_default
-            ))
-            current_color = char_color
-            current_text = char
-            current_is_default = is_default
+            print(f"Waiting for LibreOffice at {self.host}:{self.port}...")
+            if not wait_for_libreoffice(host=self.host, port=self.port):
+                print("  Socket not ready yet, trying to connect anyway")
+        
+        # Connect to LibreOffice
+        print(f"\nConnecting to LibreOffice at {self.host}:{self.port}...")
+        try:
+            self.bridge, self.context = open_bridge(host=self.host, port=self.port)
+            print("  Connected successfully!")
+        except Exception as e:
+            self.close()
+            print(f"  Connection failed: {e}")
+            print("\nTroubleshooting:")
+            print("1. Make sure LibreOffice is running:")
+            print("   ps aux | grep soffice")
+            print("2. Try starting it manually:")
+            print(f'   /Applications/LibreOffice.app/Contents/MacOS/soffice --headless --accept="socket,host={self.host},port={self.port};urp;StarOffice.ComponentContext" &')
+            print("3. In Docker containers, use host='127.0.0.1' instead of 'localhost'")
+            raise
     
-    if show_progress:
-        print(f"\r    Processing {len(cell_text)} characters... Done!     ")
+    def close(self) -> None:
+        """Close the connection, and shut down LibreOffice if this session started it."""
+        if self.process is not None and self.process.poll() is None and self.context is not None:
+            # Ask soffice to quit cleanly; the bridge drops as it exits
+            with contextlib.suppress(Exception):
+                desktop = self.context.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", self.context
+                )
+                desktop.terminate()
+        self.context = None
+        
+        with self._worker_lock:
+            worker_connections = self._worker_connections
+            self._worker_connections = []
+            self._idle_worker_contexts = []
+        for bridge, _ in worker_connections:
+            with contextlib.suppress(Exception):
+                bridge.dispose()
+        
+        if self.bridge is not None:
+            with contextlib.suppress(Exception):
+                self.bridge.dispose()
+            self.bridge = None
+        
+        if self.process is not None:
+            stop_process(self.process)
+            self.process = None
     
-    # Add final segment
-    if current_text:
-        segments.append(Segment(
-            r=current_color[0] if current_color else 0,
-            g=current_color[1] if current_color else 0,
-            b=current_color[2] if current_color else 0,
-            text=current_text,
-            is_default_color=current_is_default
-        ))
+    def acquire_worker_context(self) -> Any:
+        """
+        Borrow a worker connection, opening a new one if none is idle.
+        
+        Returns:
+            Component context to hand back with release_worker_context()
+        """
+        with self._worker_lock:
+            if self._idle_worker_contexts:
+                return self._idle_worker_contexts.pop()
+        
+        bridge, context = open_bridge(host=self.host, port=self.port)
+        with self._worker_lock:
+            self._worker_connections.append((bridge, context))
+        return context
     
-    return Cell(cell_number=cell_ref, color_groups=segments)
+    def release_worker_context(self, context: Any) -> None:
+        """Return a connection from acquire_worker_context() for reuse."""
+        with self._worker_lock:
+            # Connections opened before a close() are already disposed
+            if any(owned is context for _, owned in self._worker_connections):
+                self._idle_worker_contexts.append(context)
+    
+    def iter_cells(
+        self,
+        file_path: str,
+        workers: int = 1,
+        show_progress: bool = False,
+        write_progress: Callable[[str], Any] | None = None,
+    ) -> Iterator[Cell]:
+        """
+        Parse the first sheet of a spreadsheet, one cell at a time.
+        
+        Args:
+            file_path: Path to the spreadsheet
+            workers: Number of threads parsing cells concurrently, each over
+                its own UNO connection kept by the session (1 parses sequentially)
+            show_progress: Whether to show progress while walking long cells
+            write_progress: Where to send progress text (defaults to stdout)
+        
+        Yields:
+            Cell objects with rich text segments, in sheet order
+        """
+        print(f"Parsing {file_path} using LibreOffice UNO...")
+        self.open()
+        
+        # Load spreadsheet
+        print(f"Loading {file_path}...")
+        document = load_spreadsheet(self.context, file_path)
+        
+        try:
+            # Get first sheet
+            sheets = document.getSheets()
+            sheet = sheets.getByIndex(0)
+            
+            print(f"\nWorksheet: {sheet.getName()}")
+            print("=" * 80)
+            
+            # Iterate through used range
+            # Get the used area
+            cursor = sheet.createCursor()
+            cursor.gotoStartOfUsedArea(False)
+            cursor.gotoEndOfUsedArea(True)
+            
+            # Read the address once; each getRangeAddress() is a UNO round trip
+            address = cursor.getRangeAddress()
+            start_col, start_row = address.StartColumn, address.StartRow
+            end_col, end_row = address.EndColumn, address.EndRow
+            used_range = sheet.getCellRangeByPosition(start_col, start_row, end_col, end_row)
+            
+            # Fetch every value in the used range with a single UNO call so empty
+            # cells can be skipped without a round trip per position. Text cells come
+            # back as str, numeric cells as float and empty cells as "".
+            data = used_range.getDataArray()
+            
+            positions = [
+                (start_col + col_offset, start_row + row_offset)
+                for row_offset, row in enumerate(data)
+                for col_offset, value in enumerate(row)
+                if value != ""
+            ]
+            
+            print(f"\nFound {len(positions)} cells with text to process")
+            print("=" * 80)
+            
+            if workers > 1:
+                yield from parse_cells_concurrently(self, file_path, positions, workers=workers)
+            else:
+                # Iterate through cells
+                for col_idx, row_idx in positions:
+                    cell = sheet.getCellByPosition(col_idx, row_idx)
+                    yield parse_cell_rich_text(
+                        cell,
+                        get_cell_reference(col_idx, row_idx),
+                        show_progress=show_progress,
+                        write_progress=write_progress,
+                    )
+        finally:
+            # Drop our UNO proxies before closing so LibreOffice can free the
+            # underlying sheet objects, then let Python finalize them right away
+            sheets = sheet = cursor = used_range = cell = None
+            document.close(True)
+            del document
+            gc.collect()
+    
+    def parse(self, file_path: str, workers: int = 1, show_progress: bool = False) -> list[Cell]:
+        """Parse the first sheet of a spreadsheet into a list of cells."""
+        return list(self.iter_cells(file_path, workers=workers, show_progress=show_progress))
 
 
-def get_cell_reference(col: int, row: int) -> str:
-    """Convert column and row numbers to Excel-style reference (e.g., A1)."""
-    col_letter = ""
-    col_num = col + 1  # LibreOffice uses 0-based indexing
+_session: LibreOfficeSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_libreoffice_session(auto_start: bool = True, host: str = "localhost", port: int = 2002) -> LibreOfficeSession:
+    """
+    Return a process-wide LibreOffice session, started on first use.
     
-    while col_num > 0:
-        col_num -= 1
-        col_letter = chr(65 + (col_num % 26)) + col_letter
-        col_num //= 26
+    Asking for a different configuration closes the previous session, and
+    whatever session is left is closed when the interpreter exits.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None and (_session.auto_start, _session.host, _session.port) != (auto_start, host, port):
+            _session.close()
+            _session = None
+        if _session is None:
+            session = LibreOfficeSession(auto_start=auto_start, host=host, port=port)
+            session.open()
+            _session = session
+        return _session
+
+
+@atexit.register
+def close_libreoffice_session() -> None:
+    """Close the process-wide LibreOffice session, if one was opened."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+# Extensions parsed directly with openpyxl instead of through LibreOffice
+XLSX_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def uses_libreoffice(file_path: str) -> bool:
+    """Whether parse_workbook() needs LibreOffice for this file (anything but .xlsx/.xlsm)."""
+    return os.path.splitext(file_path)[1].lower() not in XLSX_EXTENSIONS
+
+
+def parse_workbook(
+    file_path: str = "Book.xlsx",
+    auto_start: bool = True,
+    host: str = "localhost",
+    port: int = 2002,
+    workers: int = 1,
+    show_progress: bool = False,
+    write_progress: Callable[[str], Any] | None = None,
+) -> Iterator[Cell]:
+    """
+    Parse the first sheet of an Excel file, one cell at a time.
+    
+    .xlsx/.xlsm files are read directly with openpyxl; other formats go
+    through LibreOffice UNO, and auto_start, host, port, workers and the
+    progress options only apply to that path.
+    
+    Args:
+        file_path: Path to Excel file
+        auto_start: Whether to automatically start LibreOffice
+        host: Host to connect to (use "127.0.0.1" in Docker containers)
+        port: Port to connect to
+        workers: Number of threads parsing cells concurrently, each over its
+            own UNO connection (1 parses sequentially)
+        show_progress: Whether to show progress while walking long cells
+        write_progress: Where to send progress text (defaults to stdout)
+    
+    Yields:
+        Cell objects with rich text segments, in sheet order
+    """
+    # OOXML workbooks carry their run colors in the file itself; only legacy
+    # formats need LibreOffice
+    if not uses_libreoffice(file_path):
+        yield from parse_xlsx(file_path)
+        return
     
-    return f"{col_letter}{row + 1}"
+    # Reuse one LibreOffice connection across calls; starting it is the slow part
+    session = get_libreoffice_session(auto_start=auto_start, host=host, port=port)
+    yield from session.iter_cells(
+        file_path, workers=workers, show_progress=show_progress, write_progress=write_progress
+    )
+
+
+def _print_cells(results: queue.Queue, verbose: bool) -> None:
+    """Print parsed cells and progress text from a queue until the None sentinel arrives."""
+    index = 0
+    while (item := results.get()) is not None:
+        if isinstance(item, str):
+            sys.stdout.write(item)
+            sys.stdout.flush()
+            continue
+        index += 1
+        print_cell_result(item, index, verbose)
+
+
+def _put_result(results: queue.Queue, item: Cell | str | None, printer: threading.Thread) -> None:
+    """Hand an item to the printer thread, failing instead of blocking if it has died."""
+    while True:
+        if not printer.is_alive():
+            raise RuntimeError("Result printer thread stopped unexpectedly")
+        try:
+            results.put(item, timeout=0.5)
+            return
+        except queue.Full:
+            continue
 
 
-def main(file_path: str = "Book.xlsx", auto_start: bool = True, host: str = "localhost", port: int = 2002) -> list[Cell]:
+def main(
+    file_path: str = "Book.xlsx",
+    auto_start: bool = True,
+    host: str = "localhost",
+    port: int = 2002,
+    verbose: bool = False,
+    workers: int = 1,
+) -> list[Cell]:
     """
     Main function to parse Excel file using LibreOffice.
     
+    Cells (and, when verbose, progress on long cells) are printed by a
+    background thread while parsing continues, so console output does not
+    stall the UNO round trips.
+    
     Args:
         file_path: Path to Excel file
         auto_start: Whether to automatically start LibreOffice
         host: Host to connect to (use "127.0.0.1" in Docker containers)
         port: Port to connect to
+        verbose: Print every segment of every cell instead of a one-line summary
+        workers: Number of threads parsing cells concurrently, each over its
+            own UNO connection (1 parses sequentially)
     
     Returns:
         List of Cell objects with rich text segments
     """
-    print(f"Parsing {file_path} using LibreOffice UNO...")
-    
-    # Start LibreOffice if requested
-    if auto_start:
-        print("Starting LibreOffice in headless mode...")
-        if not start_libreoffice_headless(port=port, host=host):
-            print("\nFailed to start LibreOffice automatically.")
-            print("Please start it manually:")
-            print(f'  soffice --headless --accept="socket,host={host},port={port};urp;StarOffice.ComponentContext" &')
-            print("\nOr on macOS:")
-            print(f'  /Applications/LibreOffice.app/Contents/MacOS/soffice --headless --accept="socket,host={host},port={port};urp;StarOffice.ComponentContext" &')
-            raise RuntimeError("Failed to start LibreOffice")
-    
-    # Connect to LibreOffice
-    print(f"\nConnecting to LibreOffice at {host}:{port}...")
-    try:
-        context = connect_to_libreoffice(host=host, port=port)
-        print("  Connected successfully!")
-    except Exception as e:
-        print(f"  Connection failed: {e}")
-        print("\nTroubleshooting:")
-        print("1. Make sure LibreOffice is running:")
-        print("   ps aux | grep soffice")
-        print("2. Try starting it manually:")
-        print(f'   /Applications/LibreOffice.app/Contents/MacOS/soffice --headless --accept="socket,host={host},port={port};urp;StarOffice.ComponentContext" &')
-        print("3. In Docker containers, use host='127.0.0.1' instead of 'localhost'")
-        raise
-    
-    # Load spreadsheet
-    print(f"Loading {file_path}...")
-    document = load_spreadsheet(context, file_path)
-    
-    # Get first sheet
-    sheets = document.getSheets()
-    sheet = sheets.getByIndex(0)
-    
-    print(f"\nWorksheet: {sheet.getName()}")
-    print("=" * 80)
-    
     cells: list[Cell] = []
     
-    # Iterate through used range
-    # Get the used area
-    cursor = sheet.createCursor()
-    cursor.gotoStartOfUsedArea(False)
-    cursor.gotoEndOfUsedArea(True)
-    
-    used_range = sheet.getCellRangeByPosition(
-        cursor.getRangeAddress().StartColumn,
-        cursor.getRangeAddress().StartRow,
-        cursor.getRangeAddress().EndColumn,
-        cursor.getRangeAddress().EndRow
-    )
+    results: queue.Queue = queue.Queue(maxsize=64)
+    printer = threading.Thread(target=_print_cells, args=(results, verbose), daemon=True)
+    printer.start()
     
-    # Count total cells with text for progress tracking
-    total_cells = 0
-    for row_idx in range(used_range.getRangeAddress().StartRow, 
-                         used_range.getRangeAddress().EndRow + 1):
-        for col_idx in range(used_range.getRangeAddress().StartColumn,
-                            used_range.getRangeAddress().EndColumn + 1):
-            cell = sheet.getCellByPosition(col_idx, row_idx)
-            if cell.getString():
-                total_cells += 1
-    
-    print(f"\nFound {total_cells} cells with text to process")
-    print("=" * 80)
+    def write_progress(text: str) -> None:
+        # Progress goes through the queue too so it never interleaves with cell output
+        _put_result(results, text, printer)
     
-    # Iterate through cells
-    processed_cells = 0
-    for row_idx in range(used_range.getRangeAddress().StartRow, 
-                         used_range.getRangeAddress().EndRow + 1):
-        for col_idx in range(used_range.getRangeAddress().StartColumn,
-                            used_range.getRangeAddress().EndColumn + 1):
-            cell = sheet.getCellByPosition(col_idx, row_idx)
-            cell_text = cell.getString()
-            
-            if cell_text:
-                processed_cells += 1
-                cell_ref = get_cell_reference(col_idx, row_idx)
-                
-                print(f"\n[{processed_cells}/{total_cells}] Cell {cell_ref}:")
-                cell_obj = parse_cell_rich_text(cell, cell_ref, show_progress=True)
+    # closing() runs the parser's cleanup (closing the document) right away,
+    # even when the printer dies mid-run, instead of whenever it is collected
+    cells_iter = parse_workbook(
+        file_path,
+        auto_start=auto_start,
+        host=host,
+        port=port,
+        workers=workers,
+        show_progress=verbose,
+        write_progress=write_progress,
+    )
+    try:
+        with contextlib.closing(cells_iter):
+            for cell_obj in cells_iter:
                 cells.append(cell_obj)
-                
-                # Print cell information
-                print(f"  Total segments: {len(cell_obj.color_groups)}")
-                
-                for i, segment in enumerate(cell_obj.color_groups, 1):
-                    print(f"\n  Segment {i}:")
-                    print(f"    RGB: ({segment.r}, {segment.g}, {segment.b})")
-                    print(f"    Text: {segment.text[:50]}{'...' if len(segment.text) > 50 else ''}")
-                    print(f"    is_default_color: {segment.is_default_color}")
-                    print(f"    is_black: {segment.is_black}")
-                    print(f"    is_red: {segment.is_red}")
-                    print(f"    is_blue: {segment.is_blue}")
-                
-                print()
+                _put_result(results, cell_obj, printer)
+    finally:
+        with contextlib.suppress(RuntimeError):
+            _put_result(results, None, printer)
+        printer.join()
     
     print("=" * 80)
     print(f"\nTotal cells processed: {len(cells)}")
     
-    # Close document
-    document.close(True)
-    
     return cells
 
 
 if __name__ == "__main__":
-    import sys
-    
-    file_path = sys.argv[1] if len(sys.argv) > 1 else "Book.xlsx"
+    args = [arg for arg in sys.argv[1:] if arg not in ("-v", "--verbose")]
+    verbose = len(args) != len(sys.argv) - 1
+    file_path = args[0] if args else "Book.xlsx"
     
     try:
-        cells = main(file_path, auto_start=True)
+        cells = main(file_path, auto_start=True, verbose=verbose)
     except ConnectionError as e:
         print(f"\n{e}")
         print("\nTo manually start LibreOffice, run:")
@@ -0,0 +1,102 @@
+"""Regression tests for the openpyxl .xlsx path of tech_libreoffice."""
+
+import datetime
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from openpyxl.cell.rich_text import CellRichText, TextBlock
+from openpyxl.cell.text import InlineFont
+from openpyxl.styles import Font
+from openpyxl.styles.colors import Color
+
+from tech_libreoffice import parse_xlsx
+
+
+def save_rich_cell(path, value, font=None):
+    workbook = openpyxl.Workbook()
+    workbook.active["A1"] = value
+    if font is not None:
+        workbook.active["A1"].font = font
+    workbook.save(path)
+
+
+def test_openpyxl_saved_rich_text_keeps_runs(tmp_path):
+    # openpyxl writes rich text as inline strings rather than shared strings
+    path = tmp_path / "rich.xlsx"
+    save_rich_cell(path, CellRichText(
+        TextBlock(InlineFont(color="FF0000"), "red "),
+        TextBlock(InlineFont(color="0000FF"), "blue"),
+    ))
+    
+    (cell,) = parse_xlsx(str(path))
+    
+    assert cell.cell_number == "A1"
+    assert [(s.r, s.g, s.b, s.text) for s in cell.color_groups] == [
+        (255, 0, 0, "red "),
+        (0, 0, 255, "blue"),
+    ]
+    assert cell.color_groups[0].is_red
+    assert cell.color_groups[1].is_blue
+
+
+def test_automatic_and_explicit_black_are_not_merged(tmp_path):
+    path = tmp_path / "black.xlsx"
+    # A cell font without a color makes the plain run automatic
+    save_rich_cell(path, CellRichText(
+        "automatic ",
+        TextBlock(InlineFont(color="000000"), "black"),
+    ), font=Font())
+    
+    (cell,) = parse_xlsx(str(path))
+    
+    assert [(s.text, s.is_default_color) for s in cell.color_groups] == [
+        ("automatic ", True),
+        ("black", False),
+    ]
+
+
+@pytest.mark.parametrize(("color", "rgb", "is_default"), [
+    # The default theme stores lt1/dk1 as <a:sysClr lastClr=...> and the rest as <a:srgbClr>
+    (Color(theme=0), (255, 255, 255), False),
+    (Color(theme=3), (31, 73, 125), False),
+    # Accent 1 (4F81BD) lightened 40% and darkened 25%, as Excel shows them
+    (Color(theme=4, tint=0.4), (149, 179, 215), False),
+    (Color(theme=4, tint=-0.25), (55, 96, 146), False),
+    (Color(indexed=10), (255, 0, 0), False),
+    # Indexes from SYSTEM_COLOR_INDEX up are system colors, i.e. automatic
+    (Color(indexed=64), (0, 0, 0), True),
+])
+def test_cell_font_colors_are_resolved(tmp_path, color, rgb, is_default):
+    path = tmp_path / "color.xlsx"
+    save_rich_cell(path, "text", font=Font(color=color))
+    
+    (cell,) = parse_xlsx(str(path))
+    (segment,) = cell.color_groups
+    
+    assert (segment.r, segment.g, segment.b) == rgb
+    assert segment.is_default_color is is_default
+
+
+def test_non_text_values_use_their_number_format(tmp_path):
+    path = tmp_path / "values.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet["A1"] = datetime.datetime(2024, 1, 2)
+    sheet["A1"].number_format = "mm-dd-yy"
+    sheet["A2"] = True
+    sheet["A3"] = 1.5
+    sheet["A3"].number_format = "0.00%"
+    sheet["A4"] = 1234.5
+    sheet["A4"].number_format = "#,##0.00"
+    sheet["A5"] = 150.0
+    workbook.save(path)
+    
+    assert [cell.color_groups[0].text for cell in parse_xlsx(str(path))] == [
+        "01/02/24",
+        "TRUE",
+        "150.00%",
+        "1,234.50",
+        "150",
+    ]
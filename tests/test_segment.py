@@ -0,0 +1,14 @@
+"""Tests for the Segment color helpers in tech_libreoffice."""
+
+from tech_libreoffice import ColorCategory, Segment
+
+
+def test_color_checks_follow_changes_to_rgb():
+    segment = Segment(0, 0, 0, "x")
+    assert segment.is_black
+    
+    segment.r = 255
+    
+    assert segment.category is ColorCategory.RED
+    assert segment.is_red
+    assert not segment.is_black